@@ -5,9 +5,11 @@ from pathlib import Path
 
 from helpers.parser import parse_course_timetable_html
 
+_SCRAPING_DIR = Path(__file__).resolve().parents[2]
+
 
 def main():
-    scraping_dir = Path(__file__).resolve().parents[2]
+    scraping_dir = _SCRAPING_DIR
     html_path = scraping_dir / "page_source" / "fall-winter-2025-2026" / "education.html"
     data_path = scraping_dir / "data" / "fall-winter-2025-2026" / "education.json"
 
@@ -20,7 +22,8 @@ def main():
     try:
         result = parse_course_timetable_html(html_content, extract_metadata=False)
         data_path.parent.mkdir(parents=True, exist_ok=True)
-        data_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+        with data_path.open("w", encoding="utf-8") as output_file:
+            json.dump(result, output_file, indent=2, ensure_ascii=False)
         print(f"Saved: {data_path}")
         print(f"Courses: {len(result.get('courses', []))}")
         for index, course in enumerate(result.get('courses', []), 1):
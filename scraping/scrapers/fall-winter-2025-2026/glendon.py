@@ -5,22 +5,38 @@ from pathlib import Path
 
 from helpers.parser import parse_course_timetable_html
 
+_SCRAPING_DIR = Path(__file__).resolve().parents[2]
 
-def main():
-    scraping_dir = Path(__file__).resolve().parents[2]
+
+def main(read_source=None, write_output=None):
+    """Run the scraper.
+
+    ``read_source`` and ``write_output`` are injectable callables for tests:
+    ``read_source()`` returns the page HTML and ``write_output(payload)``
+    receives the serialized JSON. Left as None, they read from and write to
+    the usual page_source/data paths.
+    """
+    scraping_dir = _SCRAPING_DIR
     html_path = scraping_dir / "page_source" / "fall-winter-2025-2026" / "glendon.html"
     data_path = scraping_dir / "data" / "fall-winter-2025-2026" / "glendon.json"
 
     try:
-        html_content = html_path.read_text(encoding="utf-8", errors="replace")
+        if read_source is not None:
+            html_content = read_source()
+        else:
+            html_content = html_path.read_text(encoding="utf-8", errors="replace")
     except Exception as error:
         print(f"Error reading HTML: {error}")
         return
 
     try:
         result = parse_course_timetable_html(html_content, extract_metadata=True)
-        data_path.parent.mkdir(parents=True, exist_ok=True)
-        data_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+        payload = json.dumps(result, indent=2, ensure_ascii=False)
+        if write_output is not None:
+            write_output(payload)
+        else:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            data_path.write_text(payload, encoding="utf-8")
         print(f"Saved: {data_path}")
         print(f"Courses: {len(result.get('courses', []))}")
         for index, course in enumerate(result.get('courses', []), 1):
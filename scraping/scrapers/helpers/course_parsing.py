@@ -4,24 +4,51 @@ import re
 from bs4 import Tag
 from typing import List, Dict, Any
 
-from .html_parsing import cell_text
+from .html_parsing import cell_text, inline_text, row_tds
 from .section_types import get_section_type as get_section_type_helper
 from .text_utils import norm_text
 from .instructor_notes import parse_instructors, parse_notes
 from .room_utils import clean_room
 
 
-def is_header_row(table_row: Tag) -> bool:
-    """Return True if a row is a course header.
+# Course summary cell: "1000 3.00 A" — id, credits, optional section letter.
+_SUMMARY_RE = re.compile(r"(\d{3,4}[A-Z]?)\s+([0-9]+\.[0-9]{2})\s*([A-Z0-9]?)")
+
+# Language-of-instruction token: 2-3 uppercase letters (e.g. "EN", "FR").
+_LOI_RE = re.compile(r"[A-Z]{2,3}")
+
+# Schedule cells draw from tiny vocabularies (day letters, campus codes,
+# duration minutes), so thousands of entries can share one object per
+# distinct value instead of allocating a fresh string each.
+_SHARED_VALUES: Dict[str, str] = {}
+
+
+def _shared(value: str) -> str:
+    return _SHARED_VALUES.setdefault(value, value)
+
+
+def bodytext_cells(table_row: Tag) -> List[Tag]:
+    """Return the direct-child bodytext TDs of a row in one contents walk."""
+    return [
+        child for child in table_row.contents
+        if getattr(child, "name", None) == "td" and "bodytext" in (child.get("class") or ())
+    ]
+
+
+def is_header_cells(cells: List[Tag]) -> bool:
+    """Return True if a row's bodytext cells mark a course header.
     A header row has 4 bodytext TDs and the 4th has colspan.
     """
-    cells = table_row.find_all("td", class_="bodytext", recursive=False)
     return len(cells) >= 4 and cells[3].has_attr("colspan")
 
 
-def parse_course_header(header_row: Tag) -> Dict[str, Any]:
-    """Parse the course header row into a base course dictionary."""
-    cells = header_row.find_all("td", class_="bodytext", recursive=False)
+def is_header_row(table_row: Tag) -> bool:
+    """Return True if a row is a course header."""
+    return is_header_cells(bodytext_cells(table_row))
+
+
+def parse_course_header_cells(cells: List[Tag]) -> Dict[str, Any]:
+    """Build a base course dictionary from a header row's bodytext cells."""
     return {
         "faculty": cell_text(cells[0]),
         "department": cell_text(cells[1]),
@@ -34,6 +61,11 @@ def parse_course_header(header_row: Tag) -> Dict[str, Any]:
     }
 
 
+def parse_course_header(header_row: Tag) -> Dict[str, Any]:
+    """Parse the course header row into a base course dictionary."""
+    return parse_course_header_cells(bodytext_cells(header_row))
+
+
 def get_section_type(text: str) -> str:
     """Normalize a raw section type token to a canonical type (e.g., 'LECT', 'LAB')."""
     return get_section_type_helper(text, norm_text)
@@ -41,20 +73,30 @@ def get_section_type(text: str) -> str:
 
 def find_section_type_index(row_cells: List[Tag]) -> int | None:
     """Return the index of the cell containing the section type, or None if absent."""
+    return _scan_section_type(row_cells)[0]
+
+
+def _scan_section_type(row_cells: List[Tag]) -> tuple[int | None, str, List[str]]:
+    # Extract cell texts only up to the section-type cell, returning the
+    # matched type and the texts gathered so far. Stopping at the match keeps
+    # get_text off the schedule cell, whose subtree can be huge on the live
+    # pages when the unclosed <td> swallows trailing markup.
+    row_texts: List[str] = []
     for index, cell in enumerate(row_cells):
-        if get_section_type(cell_text(cell)):
-            return index
-    return None
+        text = cell_text(cell)
+        row_texts.append(text)
+        section_type = get_section_type(text)
+        if section_type:
+            return index, section_type, row_texts
+    return None, "", row_texts
 
 
-def fill_course_summary_and_loi(row_cells: List[Tag], section_type_index: int, course: Dict[str, Any]) -> str:
+def fill_course_summary_and_loi(row_texts: List[str], section_type_index: int, course: Dict[str, Any]) -> str:
     """Populate courseId, credits, language of instruction, and return section letter."""
     section_letter = ""
 
-    pattern = r"(\d{3,4}[A-Z]?)\s+([0-9]+\.[0-9]{2})\s*([A-Z0-9]?)"
-    summary_pattern = re.compile(pattern)
     for j in range(section_type_index - 1, -1, -1):
-        match = summary_pattern.search(cell_text(row_cells[j]))
+        match = _SUMMARY_RE.search(row_texts[j])
         if match:
             course_id, credits, section_letter = match.group(1), match.group(2), match.group(3)
             if not course.get("courseId"):
@@ -65,8 +107,8 @@ def fill_course_summary_and_loi(row_cells: List[Tag], section_type_index: int, c
 
     if not course.get("languageOfInstruction"):
         for j in range(section_type_index - 1, -1, -1):
-            token = cell_text(row_cells[j])
-            if 1 < len(token) <= 3 and token.isupper() and token.isalpha():
+            token = row_texts[j]
+            if _LOI_RE.fullmatch(token):
                 course["languageOfInstruction"] = token
                 break
 
@@ -75,31 +117,36 @@ def fill_course_summary_and_loi(row_cells: List[Tag], section_type_index: int, c
 
 def parse_schedule_entry(schedule_cells: List[Tag]) -> Dict[str, str]:
     """Parse a schedule table row into a schedule entry dict."""
+    day, time, duration, campus, room = (cell_text(cell) for cell in schedule_cells[:5])
     return {
-        "day": cell_text(schedule_cells[0]),
-        "time": cell_text(schedule_cells[1]),
-        "duration": cell_text(schedule_cells[2]),
-        "campus": cell_text(schedule_cells[3]),
-        "room": clean_room(cell_text(schedule_cells[4])),
+        "day": _shared(day),
+        "time": _shared(time),
+        "duration": _shared(duration),
+        "campus": _shared(campus),
+        "room": clean_room(room),
     }
 
 
-def build_details(row_cells: List[Tag], section_type_index: int) -> tuple[List[Dict[str, str]], List[str], str, str, bool]:
+def build_details(row_cells: List[Tag], row_texts: List[str], section_type_index: int) -> tuple[List[Dict[str, str]], List[str], str, str, bool]:
     """Construct schedule, instructors, notes, catalog_number and is_cancelled for a section row."""
     schedule: List[Dict[str, str]] = []
-    catalog_cell = row_cells[section_type_index + 2] if len(row_cells) > section_type_index + 2 else None
     schedule_cell = row_cells[section_type_index + 3] if len(row_cells) > section_type_index + 3 else None
     instructors: List[str] = []
     notes = ""
 
-    catalog_number = cell_text(catalog_cell) if catalog_cell else ""
+    catalog_number = row_texts[section_type_index + 2] if len(row_texts) > section_type_index + 2 else ""
     is_cancelled = catalog_number.lower() == "cancelled"
 
     if schedule_cell is not None:
         inner_table = schedule_cell.find("table")
         if inner_table:
-            for schedule_row in inner_table.find_all("tr"):
-                schedule_cells = schedule_row.find_all("td")
+            # The schedule table is the innermost, highest-count structure, so
+            # its rows and cells are filtered by tag name directly rather than
+            # through find_all's matcher machinery.
+            for schedule_row in inner_table.descendants:
+                if getattr(schedule_row, "name", None) != "tr":
+                    continue
+                schedule_cells = row_tds(schedule_row)
                 if len(schedule_cells) >= 5:
                     schedule_entry = parse_schedule_entry(schedule_cells)
                     if any(schedule_entry.values()):
@@ -109,11 +156,18 @@ def build_details(row_cells: List[Tag], section_type_index: int) -> tuple[List[D
             if schedule_text and schedule_text.lower() != "cancelled":
                 schedule.append({"day": "", "time": schedule_text, "duration": "", "campus": "", "room": ""})
 
-        nested_tds = schedule_cell.find_all("td", recursive=False)
+        nested_tds = row_tds(schedule_cell)
+        if not nested_tds:
+            # The live pages leave the schedule <td> unclosed, so html.parser
+            # makes the instructor/notes cells its children, but lxml's table
+            # fix-up closes the cell and hoists them to row level. When the
+            # schedule cell has no nested TDs, look for them among the row's
+            # trailing cells instead.
+            nested_tds = row_cells[section_type_index + 4:section_type_index + 6]
         if len(nested_tds) >= 1:
-            instructors = parse_instructors(nested_tds[0].decode_contents())
+            instructors = parse_instructors(inline_text(nested_tds[0]))
         if len(nested_tds) >= 2:
-            notes = parse_notes(nested_tds[1].decode_contents())
+            notes = parse_notes(inline_text(nested_tds[1], br_separator=" | "))
 
     return schedule, instructors, notes, catalog_number, is_cancelled
 
@@ -122,17 +176,17 @@ def maybe_extract_cancelled_notes(row_cells: List[Tag], section_type_index: int,
     """For cancelled rows, attempt to read notes from sibling TDs at offsets 4 and 5."""
     for offset in [4, 5]:
         if len(row_cells) > section_type_index + offset:
-            potential_notes = parse_notes(row_cells[section_type_index + offset].decode_contents())
+            potential_notes = parse_notes(inline_text(row_cells[section_type_index + offset], br_separator=" | "))
             if potential_notes and potential_notes.strip():
                 return potential_notes
     return notes
 
 
-def make_section_detail(row_cells: List[Tag], section_type_index: int, section_type: str, section_letter: str, catalog_number: str, schedule: List[Dict[str, str]], instructors: List[str], notes: str) -> Dict[str, Any]:
+def make_section_detail(row_texts: List[str], section_type_index: int, section_type: str, section_letter: str, catalog_number: str, schedule: List[Dict[str, str]], instructors: List[str], notes: str) -> Dict[str, Any]:
     """Build the final section detail dictionary from parsed components."""
     section_detail: Dict[str, Any] = {
         "type": section_type,
-        "meetNumber": cell_text(row_cells[section_type_index + 1]) if len(row_cells) > section_type_index + 1 else "",
+        "meetNumber": row_texts[section_type_index + 1] if len(row_texts) > section_type_index + 1 else "",
     }
     if section_letter:
         section_detail["section"] = section_letter
@@ -149,25 +203,27 @@ def make_section_detail(row_cells: List[Tag], section_type_index: int, section_t
 def parse_section_row(row_cells: List[Tag], course: Dict[str, Any]) -> Dict[str, Any] | None:
     """Parse a section row into a detail dict and update course summary/LOI.
     Returns a section detail or None if the row doesn't contain a section type."""
-    # 1) Locate the section type column
-    section_type_index = find_section_type_index(row_cells)
+    # 1) Locate the section type column, collecting each scanned cell's text
+    # once so the steps below reuse the list instead of re-walking subtrees
+    section_type_index, section_type, row_texts = _scan_section_type(row_cells)
     if section_type_index is None:
         return None
 
-    # 2) Update course summary (courseId/credits) and LOI
-    section_letter = fill_course_summary_and_loi(row_cells, section_type_index, course)
+    # Only the meet-number and catalog cells are read as text past the type
+    # cell; the schedule cell and anything after it stay Tag-only.
+    row_texts.extend(cell_text(cell) for cell in row_cells[section_type_index + 1:section_type_index + 3])
 
-    # 3) Determine section type
-    section_type = get_section_type(cell_text(row_cells[section_type_index]))
+    # 2) Update course summary (courseId/credits) and LOI
+    section_letter = fill_course_summary_and_loi(row_texts, section_type_index, course)
 
-    # 4) Build schedule/instructors/notes and catalog
-    schedule, instructors, notes, catalog_number, is_cancelled = build_details(row_cells, section_type_index)
+    # 3) Build schedule/instructors/notes and catalog
+    schedule, instructors, notes, catalog_number, is_cancelled = build_details(row_cells, row_texts, section_type_index)
 
-    # 5) Extract notes for cancelled entries (malformed sibling TDs)
+    # 4) Extract notes for cancelled entries (malformed sibling TDs)
     notes = maybe_extract_cancelled_notes(row_cells, section_type_index, notes) if is_cancelled and not notes else notes
 
-    # 6) Build section detail and return if non-empty
-    section_detail = make_section_detail(row_cells, section_type_index, section_type, section_letter, catalog_number, schedule, instructors, notes)
+    # 5) Build section detail and return if non-empty
+    section_detail = make_section_detail(row_texts, section_type_index, section_type, section_letter, catalog_number, schedule, instructors, notes)
     has_content = any([
         bool(section_type),
         bool(section_detail.get("meetNumber")),
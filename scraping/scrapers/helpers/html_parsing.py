@@ -1,16 +1,55 @@
 """HTML parsing utilities."""
 
-from bs4 import Tag
-from typing import Optional
+from bs4 import NavigableString, Tag
+from typing import List, Optional
 
-from .text_utils import norm_text
+from .text_utils import NBSP_TRANS
+
+
+def row_tds(row: Tag) -> List[Tag]:
+    """Return the direct-child <td> cells of a row.
+
+    Filtering .contents directly avoids the matcher machinery that
+    find_all("td", recursive=False) runs per child.
+    """
+    return [child for child in row.contents if getattr(child, "name", None) == "td"]
 
 
 def cell_text(element: Optional[Tag]) -> str:
     """Extract text from a BeautifulSoup element with normalized spacing and trimming."""
     if element is None:
         return ""
-    text = element.get_text(" ", strip=True)
-    text = text.replace("\xa0", " ")
-    return norm_text(text)
+    # get_text already yields entity-decoded text, so only NBSP replacement
+    # and whitespace collapsing remain.
+    text = element.get_text(" ", strip=True).translate(NBSP_TRANS)
+    return " ".join(text.split())
+
+
+def inline_text(element: Tag, br_separator: str = "|") -> str:
+    """Flatten a tag's subtree to text, mapping <br> to the given separator.
+
+    Walking the tree yields already-decoded strings, so callers avoid the
+    decode_contents round trip of re-serializing inner HTML only to strip the
+    tags back out again.
+    """
+    parts: List[str] = []
+    _collect_inline_text(element, br_separator, parts)
+    return "".join(parts)
+
+
+def _collect_inline_text(element: Tag, br_separator: str, parts: List[str]) -> None:
+    for node in element.contents:
+        name = getattr(node, "name", None)
+        if name is None:
+            if isinstance(node, NavigableString):
+                parts.append(str(node))
+        elif name == "br":
+            parts.append(br_separator)
+        else:
+            # Other tags acted as whitespace when inner HTML was serialized
+            # and regex-stripped, so pad both boundaries to keep adjacent
+            # words apart; callers collapse whitespace runs anyway.
+            parts.append(" ")
+            _collect_inline_text(node, br_separator, parts)
+            parts.append(" ")
 
@@ -3,21 +3,27 @@
 import re
 from typing import List
 
-from .text_utils import norm_text, html_to_text
+from .text_utils import html_to_text
+
+# Leftover entity names that sometimes survive as bare tokens in instructor cells.
+_HTML_ARTIFACTS = frozenset({"nbsp", "amp", "lt", "gt", "quot", "apos", "#160"})
+
+# Instructor cells separate names with pipes (from <br> conversion), commas,
+# semicolons, or ampersands; the pattern swallows surrounding whitespace so
+# the split parts come out already trimmed.
+_SEP_RE = re.compile(r"\s*[|,;&]\s*")
 
 
 def parse_instructors(instructor_html: str) -> List[str]:
     """Parse instructor HTML into a list of instructor names, handling separators and HTML artifacts."""
     if not instructor_html:
         return []
+    # html_to_text output is already entity-decoded and whitespace-normalized,
+    # and the separator pattern trims around each split, so the parts need no
+    # further normalization.
     text = html_to_text(instructor_html, br_separator="|")
-    parts = re.split(r"[|,;&]", text)
-    instructors_list: List[str] = []
-    for part in parts:
-        name = norm_text(part)
-        if name and name.lower() not in {"nbsp", "amp", "lt", "gt"}:
-            instructors_list.append(name)
-    return instructors_list
+    parts = _SEP_RE.split(text)
+    return [part for part in parts if part and part.lower() not in _HTML_ARTIFACTS]
 
 
 def parse_notes(notes_html: str) -> str:
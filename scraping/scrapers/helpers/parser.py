@@ -4,20 +4,35 @@ Main parser orchestration utilities.
 This is where the parsing is initiated.
 """
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Dict, Any, List
 
-from .html_parsing import cell_text
+from .html_parsing import cell_text, row_tds
 from .course_parsing import (
-    is_header_row,
-    parse_course_header,
+    bodytext_cells,
+    is_header_cells,
+    parse_course_header_cells,
     parse_section_row,
 )
 
+# Prefer the C-based lxml backend; the pure-Python html.parser is an order of
+# magnitude slower on the multi-hundred-KB timetable pages.
+try:
+    import lxml  # noqa: F401
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
+
+# Only tables — plus the heading paragraphs when metadata is requested — are
+# ever consulted, so skip building tree nodes for the rest of the page.
+_TABLES_ONLY = SoupStrainer("table")
+_TABLES_AND_PARAGRAPHS = SoupStrainer(["table", "p"])
+
 
 def parse_course_timetable_html(html_content: str, extract_metadata: bool = False) -> Dict[str, Any]:
     """Parse HTML timetable into structured course data."""
-    soup = BeautifulSoup(html_content, "html.parser")
+    parse_only = _TABLES_AND_PARAGRAPHS if extract_metadata else _TABLES_ONLY
+    soup = BeautifulSoup(html_content, _PARSER, parse_only=parse_only)
 
     metadata = None
     if extract_metadata:
@@ -36,27 +51,26 @@ def parse_course_timetable_html(html_content: str, extract_metadata: bool = Fals
             return {"metadata": metadata, "courses": []}
         return {"courses": []}
 
-    # Orchestrate parsing with module-level helpers
+    # Single pass over the rows: each header starts a new course and every
+    # following row is parsed against it, instead of re-walking the tree from
+    # each header to find that course's section rows.
     courses: List[Dict[str, Any]] = []
-    header_rows = [table_row for table_row in table.find_all("tr") if is_header_row(table_row)]
-    for header_row in header_rows:
-        course = parse_course_header(header_row)
-        for element in header_row.next_elements:
-            if not isinstance(element, Tag):
-                continue
-            if element is header_row:
-                continue
-            if element.name != "tr":
-                continue
-            if is_header_row(element):
-                break
-            row_cells = element.find_all("td", recursive=False)
-            if not row_cells:
-                continue
-            section_detail = parse_section_row(row_cells, course)
-            if section_detail is not None:
-                course["sections"].append(section_detail)
-        courses.append(course)
+    current_course = None
+    for table_row in table.find_all("tr"):
+        # One child walk serves both header detection and header parsing.
+        header_cells = bodytext_cells(table_row)
+        if is_header_cells(header_cells):
+            current_course = parse_course_header_cells(header_cells)
+            courses.append(current_course)
+            continue
+        if current_course is None:
+            continue
+        row_cells = row_tds(table_row)
+        if not row_cells:
+            continue
+        section_detail = parse_section_row(row_cells, current_course)
+        if section_detail is not None:
+            current_course["sections"].append(section_detail)
 
     result = {"courses": courses}
     if metadata:
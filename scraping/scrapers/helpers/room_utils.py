@@ -1,10 +1,14 @@
 """Room text cleaning utilities."""
 
-from .text_utils import norm_text
+import html
+
+from .text_utils import NBSP_TRANS
 
 
 def clean_room(room_text: str) -> str:
     """Normalize room text. Placeholder for future room-specific cleaning rules."""
-    cleaned_text = norm_text(room_text)
-    return cleaned_text
-
+    if not room_text:
+        return ""
+    if "&" in room_text:
+        room_text = html.unescape(room_text)
+    return " ".join(room_text.translate(NBSP_TRANS).split())
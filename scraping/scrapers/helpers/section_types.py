@@ -5,6 +5,10 @@ and variants to their canonical normalized forms.
 """
 
 import re
+import sys
+from functools import lru_cache
+
+from .text_utils import norm_text
 
 # Section type mappings
 # Format: (pattern, normalized_type)
@@ -73,20 +77,86 @@ SECTION_TYPE_MAPPINGS = [
     ("INDIVIDUALDIRECTEDSTUDY", "IDS"),
 ]
 
+# Freeze the table and intern the canonical codes: the codes are compared by
+# equality all over the output pipeline, and interned strings resolve those
+# compares on CPython's identity fast path.
+SECTION_TYPE_MAPPINGS = tuple(
+    (pattern, sys.intern(normalized_type))
+    for pattern, normalized_type in SECTION_TYPE_MAPPINGS
+)
+
+
+# Precomputed translate table that uppercases letters and deletes every other
+# Latin-1 character in a single C-level pass. Characters above Latin-1 pass
+# through translate untouched, so those rare inputs fall back to the regex.
+_COMPACT_TABLE = {code: None for code in range(256)}
+for _offset in range(26):
+    _COMPACT_TABLE[ord("A") + _offset] = ord("A") + _offset
+    _COMPACT_TABLE[ord("a") + _offset] = ord("A") + _offset
+del _offset
+
+_NON_ALPHA_RE = re.compile(r"[^A-Z]")
+
+
+def _compact(text: str) -> str:
+    """Strip a normalized token down to its uppercase letters."""
+    compact_text = text.translate(_COMPACT_TABLE)
+    if not compact_text.isascii():
+        compact_text = _NON_ALPHA_RE.sub("", compact_text.upper())
+    return compact_text
+
+
+# Sorted by pattern length once at import so more specific patterns still
+# match first when the substring scan runs.
+_SORTED_MAPPINGS = sorted(SECTION_TYPE_MAPPINGS, key=lambda x: len(x[0]), reverse=True)
+
+# Almost every real cell contains exactly one section token, so an exact
+# compact-text hit resolves with a single dict probe before the scan.
+_EXACT_MATCHES = dict(_SORTED_MAPPINGS)
+
+
+def _lookup(normalized_text: str) -> str:
+    """Resolve an already-normalized token to its canonical type."""
+    compact_text = _compact(normalized_text)
+
+    exact_match = _EXACT_MATCHES.get(compact_text)
+    if exact_match is not None:
+        return exact_match
+
+    # A pattern can only match if its first letter occurs somewhere in the
+    # token, so a set probe skips most of the list before the substring check.
+    chars_present = set(compact_text)
+    for pattern, normalized_type in _SORTED_MAPPINGS:
+        if pattern[0] in chars_present and pattern in compact_text:
+            return normalized_type
+
+    return ""
+
+
+@lru_cache(maxsize=2048)
+def _get_section_type_cached(text: str) -> str:
+    return _lookup(norm_text(text))
+
 
 def get_section_type(text: str, norm_text_func) -> str:
     """
     Normalize a raw section type token to a canonical type (e.g., 'LECT', 'LAB').
     """
-    normalized_text = norm_text_func(text).upper()
-    compact_text = re.sub(r"[^A-Z]", "", normalized_text)
-    
-    # Sort patterns by length to match more specific first
-    sorted_mappings = sorted(SECTION_TYPE_MAPPINGS, key=lambda x: len(x[0]), reverse=True)
-    
-    for pattern, normalized_type in sorted_mappings:
-        if pattern in compact_text:
-            return normalized_type
-    
-    return ""
+    # Section labels recur constantly across a timetable, so the default
+    # normalizer goes through a memoized path keyed on the raw text.
+    if norm_text_func is norm_text:
+        return _get_section_type_cached(text)
+    return _lookup(norm_text_func(text))
+
+
+def get_section_types_batch(texts, norm_text_func=norm_text) -> list:
+    """
+    Resolve an iterable of raw section tokens to canonical types in one call.
+
+    Batch counterpart of get_section_type for callers that already hold a
+    whole table's worth of tokens; shares the same memoized lookup path.
+    """
+    if norm_text_func is norm_text:
+        return [_get_section_type_cached(text) for text in texts]
+    return [_lookup(norm_text_func(text)) for text in texts]
 
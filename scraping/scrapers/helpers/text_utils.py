@@ -2,15 +2,36 @@
 
 import html
 import re
+from functools import lru_cache
+
+# Shared cleanup table; str.translate is a single C pass over the string.
+# NBSP becomes a regular space and zero-width spaces are dropped outright —
+# str.split collapses the former but would leave the latter embedded in words.
+NBSP_TRANS = str.maketrans({"\xa0": " ", "\u200b": ""})
+
+
+@lru_cache(maxsize=4096)
+def _norm_text_cached(text: str) -> str:
+    # Most cells carry no entities, so skip the pure-Python unescape for them.
+    if "&" in text:
+        text = html.unescape(text)
+    # Bare str.split collapses any whitespace run in C, so this beats the
+    # regex sub + strip for the short strings cells produce.
+    return " ".join(text.split())
 
 
 def norm_text(text: str) -> str:
     """Normalize text by unescaping HTML entities, collapsing whitespace, and trimming."""
-    if text is None:
+    if not text:
         return ""
-    text = html.unescape(text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # Cell values repeat heavily (day names, campuses, language codes), so the
+    # real work is memoized; only the None/empty guard stays outside the cache.
+    return _norm_text_cached(text)
+
+
+# One alternation handles both <br> (group 1) and every other tag, so tag
+# stripping is a single pass instead of two chained substitutions.
+_TAG_RE = re.compile(r"(<br\s*/?>)|<[^>]+>", re.IGNORECASE)
 
 
 def html_to_text(html_fragment: str, br_separator: str = "|") -> str:
@@ -22,9 +43,9 @@ def html_to_text(html_fragment: str, br_separator: str = "|") -> str:
     """
     if not html_fragment:
         return ""
-    text = html.unescape(html_fragment)
-    text = re.sub(r"<br\s*/?>", br_separator, text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    text = html.unescape(html_fragment) if "&" in html_fragment else html_fragment
+    # Plain-text fragments (no tags) skip the substitution pass entirely.
+    if "<" in text:
+        text = _TAG_RE.sub(lambda match: br_separator if match.group(1) else " ", text)
+    return " ".join(text.split())
 
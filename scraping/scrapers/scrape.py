@@ -1,7 +1,9 @@
 """Run all course timetable scrapers."""
 
 import sys
+import json
 import importlib.util
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 from datetime import datetime
@@ -13,28 +15,41 @@ sys.path.insert(0, str(fall_winter_dir))
 sys.path.insert(1, str(summer_dir))
 sys.path.insert(2, str(scrapers_dir))
 
+@lru_cache(maxsize=None)
 def _title_from_stem(stem: str) -> str:
     return stem.replace("_", " ").title()
 
 
-def _load_scrapers(root: Path) -> List[Tuple[str, object, str]]:
-    scrapers: List[Tuple[str, object, str]] = []
+def _load_scrapers(root: Path) -> List[Tuple[str, object, str, Path]]:
+    # The term directory is just the name of the directory being loaded, and
+    # each scraper writes to data/<term>/<stem>.json, so the output path can
+    # be computed once here instead of resolving module paths per scraper.
+    term_dir = root.name  # update for new sessions
+    data_dir = scrapers_dir.parent / "data" / term_dir
+
+    scrapers: List[Tuple[str, object, str, Path]] = []
     for path in sorted(root.glob("*.py")):
         if path.name.startswith("_"):
             continue
         module_name = path.stem
-        spec = importlib.util.spec_from_file_location(module_name, path)
-        if spec is None or spec.loader is None:
-            continue
-        module = importlib.util.module_from_spec(spec)
-        try:
-            spec.loader.exec_module(module)
-        except Exception as error:
-            print(f"Error importing {module_name}: {error}")
-            continue
+        # Reuse the interpreter's own module cache on repeat invocations so a
+        # warm call of main() skips re-executing every scraper module. The
+        # __file__ check keeps same-stem scrapers from different terms apart.
+        module = sys.modules.get(module_name)
+        if module is None or getattr(module, "__file__", None) != str(path):
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None or spec.loader is None:
+                continue
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+            except Exception as error:
+                print(f"Error importing {module_name}: {error}")
+                continue
+            sys.modules[module_name] = module
         if not hasattr(module, "main"):
             continue
-        scrapers.append((module_name, module, _title_from_stem(module_name)))
+        scrapers.append((module_name, module, _title_from_stem(module_name), data_dir / f"{module_name}.json"))
 
     if not scrapers:
         print(f"No scrapers found in {root}")
@@ -43,12 +58,16 @@ def _load_scrapers(root: Path) -> List[Tuple[str, object, str]]:
     return scrapers
 
 
-def run_scraper(name: str, scraper_module, description: str) -> Dict[str, Any]:
-    print(f"\n{'='*70}")
-    print(f"Running {name} scraper")
-    print(f"{description}")
-    print(f"{'='*70}\n")
-    
+def run_scraper(name: str, scraper_module, description: str, data_path: Path) -> Dict[str, Any]:
+    # Buffer our own banner/status lines and flush them with a single write so
+    # each scraper's output reaches stdout in one syscall.
+    out = [
+        f"\n{'='*70}\n",
+        f"Running {name} scraper\n",
+        f"{description}\n",
+        f"{'='*70}\n\n",
+    ]
+
     result = {
         "name": name,
         "description": description,
@@ -58,44 +77,25 @@ def run_scraper(name: str, scraper_module, description: str) -> Dict[str, Any]:
         "timestamp": datetime.now().isoformat()
     }
     
+    sys.stdout.write("".join(out))
+    out = []
+
     try:
         scraper_module.main()
         result["success"] = True
         
-        scraper_path = Path(scraper_module.__file__).resolve()
-        scraping_dir = scraper_path.parents[2]
-        scraper_name = scraper_path.stem
-        term_dir = None
-        if "fall-winter-2025-2026" in scraper_path.parts: # update for new sessions
-            term_dir = "fall-winter-2025-2026"
-        elif "summer-2026" in scraper_path.parts:
-            term_dir = "summer-2026"
-
-
-        candidate_paths = []
-        if term_dir:
-            candidate_paths.append(scraping_dir / "data" / term_dir / f"{scraper_name}.json")
-        else:
-            candidate_paths.extend([ # update for new sessions
-                scraping_dir / "data" / f"{scraper_name}.json",
-                scraping_dir / "data" / "fall-winter-2025-2026" / f"{scraper_name}.json",
-                scraping_dir / "data" / "summer-2026" / f"{scraper_name}.json"
-                
-            ])
-
-        for data_path in candidate_paths:
-            if data_path.exists():
-                import json
-                with open(data_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    result["courses_count"] = len(data.get('courses', []))
-                break
-        
+        if data_path.exists():
+            with open(data_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                result["courses_count"] = len(data.get('courses', []))
+
     except Exception as e:
         result["success"] = False
         result["error"] = str(e)
-        print(f"Error in {name} scraper: {e}")
-    
+        out.append(f"Error in {name} scraper: {e}\n")
+
+    if out:
+        sys.stdout.write("".join(out))
     return result
 
 
@@ -109,10 +109,16 @@ def main():
     scrapers = _load_scrapers(fall_winter_dir)
     scrapers += _load_scrapers(summer_dir)
     
+    # Stream each result to a JSONL run log as it completes so external
+    # monitors can follow progress; the in-memory list only feeds the summary.
     results = []
-    for name, module, description in scrapers:
-        result = run_scraper(name, module, description)
-        results.append(result)
+    run_log_path = scrapers_dir.parent / "data" / "run_log.jsonl"
+    run_log_path.parent.mkdir(parents=True, exist_ok=True)
+    with run_log_path.open("w", encoding="utf-8") as run_log:
+        for name, module, description, data_path in scrapers:
+            result = run_scraper(name, module, description, data_path)
+            run_log.write(json.dumps(result) + "\n")
+            results.append(result)
     
     # Print summary
     print("\n" + "="*70)
@@ -129,14 +135,14 @@ def main():
     print(f"Total courses scraped: {total_courses}\n")
     
     if successful:
-        print("Successful scrapers:")
-        for result in successful:
-            print(f"  {result['name']:20} - {result['courses_count']:4} courses")
-    
+        print("Successful scrapers:\n" + "\n".join(
+            f"  {result['name']:20} - {result['courses_count']:4} courses" for result in successful
+        ))
+
     if failed:
-        print("\nFailed scrapers:")
-        for result in failed:
-            print(f"  {result['name']:20} - {result['error']}")
+        print("\nFailed scrapers:\n" + "\n".join(
+            f"  {result['name']:20} - {result['error']}" for result in failed
+        ))
     
     print(f"\nCompleted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
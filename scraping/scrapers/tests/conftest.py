@@ -0,0 +1,19 @@
+"""Shared sys.path setup for the scraper test suite.
+
+Resolving these paths once here replaces the sys.path.insert boilerplate
+that individual test modules used to repeat at import time.
+"""
+
+import sys
+from pathlib import Path
+
+_scrapers_dir = Path(__file__).resolve().parent.parent
+_repo_root = _scrapers_dir.parents[1]
+
+for _path in (
+    _scrapers_dir / "fall-winter-2025-2026",
+    _scrapers_dir,
+    _repo_root,
+):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
@@ -3,7 +3,7 @@
 import unittest
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import patch, mock_open
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "fall-winter-2025-2026"))
 
@@ -46,7 +46,7 @@ class TestEducationIntegration(unittest.TestCase):
         """
 
         with patch('pathlib.Path.read_text', return_value=test_html), \
-             patch('pathlib.Path.write_text') as mock_write, \
+             patch('pathlib.Path.open', mock_open()) as mock_write, \
              patch('pathlib.Path.mkdir'), \
              patch('builtins.print') as mock_print:
 
@@ -61,7 +61,7 @@ class TestEducationIntegration(unittest.TestCase):
         invalid_html = "<html><invalid></html>"
 
         with patch('pathlib.Path.read_text', return_value=invalid_html), \
-             patch('pathlib.Path.write_text'), \
+             patch('pathlib.Path.open', mock_open()), \
              patch('pathlib.Path.mkdir'), \
              patch('builtins.print') as mock_print:
 
@@ -73,7 +73,7 @@ class TestEducationIntegration(unittest.TestCase):
         test_html = "<table></table>"
 
         with patch('pathlib.Path.read_text', return_value=test_html), \
-             patch('pathlib.Path.write_text'), \
+             patch('pathlib.Path.open', mock_open()), \
              patch('pathlib.Path.mkdir'), \
              patch('education.parse_course_timetable_html') as mock_parse, \
              patch('builtins.print'):
@@ -93,7 +93,7 @@ class TestEducationIntegration(unittest.TestCase):
         with patch('pathlib.Path.read_text', return_value=test_html), \
              patch('pathlib.Path.mkdir'), \
              patch('education.parse_course_timetable_html') as mock_parse, \
-             patch('pathlib.Path.write_text', side_effect=Exception("Write error")), \
+             patch('pathlib.Path.open', side_effect=Exception("Write error")), \
              patch('builtins.print') as mock_print, \
              patch('traceback.print_exc') as mock_traceback:
 
@@ -138,7 +138,7 @@ class TestEducationIntegration(unittest.TestCase):
         }
 
         with patch('pathlib.Path.read_text', return_value=test_html), \
-             patch('pathlib.Path.write_text'), \
+             patch('pathlib.Path.open', mock_open()), \
              patch('pathlib.Path.mkdir'), \
              patch('education.parse_course_timetable_html', return_value=mock_result), \
              patch('builtins.print') as mock_print:
@@ -48,7 +48,7 @@ class TesthealthIntegration(unittest.TestCase):
         """
         
         with patch('pathlib.Path.read_text', return_value=test_html), \
-             patch('pathlib.Path.write_text') as mock_write, \
+             patch('pathlib.Path.open', mock_open()) as mock_write, \
              patch('pathlib.Path.mkdir'), \
              patch('builtins.print') as mock_print:
             
@@ -66,7 +66,7 @@ class TesthealthIntegration(unittest.TestCase):
         invalid_html = "<html><invalid></html>"
         
         with patch('pathlib.Path.read_text', return_value=invalid_html), \
-             patch('pathlib.Path.write_text'), \
+             patch('pathlib.Path.open', mock_open()), \
              patch('pathlib.Path.mkdir'), \
              patch('builtins.print') as mock_print:
             
@@ -80,7 +80,7 @@ class TesthealthIntegration(unittest.TestCase):
         test_html = "<table></table>"
         
         with patch('pathlib.Path.read_text', return_value=test_html), \
-            patch('pathlib.Path.write_text'), \
+            patch('pathlib.Path.open', mock_open()), \
             patch('pathlib.Path.mkdir'), \
             patch('health.parse_course_timetable_html') as mock_parse, \
             patch('builtins.print'):
@@ -101,7 +101,7 @@ class TesthealthIntegration(unittest.TestCase):
         with patch('pathlib.Path.read_text', return_value=test_html), \
             patch('pathlib.Path.mkdir'), \
             patch('health.parse_course_timetable_html') as mock_parse, \
-            patch('pathlib.Path.write_text', side_effect=Exception("Write error")), \
+            patch('pathlib.Path.open', side_effect=Exception("Write error")), \
             patch('builtins.print') as mock_print, \
             patch('traceback.print_exc') as mock_traceback:
             
@@ -48,14 +48,14 @@ class TestLassondeIntegration(unittest.TestCase):
         """
         
         with patch('pathlib.Path.read_text', return_value=test_html), \
-             patch('pathlib.Path.write_text') as mock_write, \
+             patch('pathlib.Path.open', mock_open()) as mock_file, \
              patch('pathlib.Path.mkdir'), \
              patch('builtins.print') as mock_print:
-            
+
             lassonde.main()
-            
+
             # Verify write was called
-            self.assertTrue(mock_write.called)
+            self.assertTrue(mock_file.called)
             
             # Verify success message was printed
             call_args = [str(call) for call in mock_print.call_args_list]
@@ -66,7 +66,7 @@ class TestLassondeIntegration(unittest.TestCase):
         invalid_html = "<html><invalid></html>"
         
         with patch('pathlib.Path.read_text', return_value=invalid_html), \
-             patch('pathlib.Path.write_text'), \
+             patch('pathlib.Path.open', mock_open()), \
              patch('pathlib.Path.mkdir'), \
              patch('builtins.print') as mock_print:
             
@@ -80,7 +80,7 @@ class TestLassondeIntegration(unittest.TestCase):
         test_html = "<table></table>"
         
         with patch('pathlib.Path.read_text', return_value=test_html), \
-            patch('pathlib.Path.write_text'), \
+            patch('pathlib.Path.open', mock_open()), \
             patch('pathlib.Path.mkdir'), \
             patch('lassonde.parse_course_timetable_html') as mock_parse, \
             patch('builtins.print'):
@@ -101,7 +101,7 @@ class TestLassondeIntegration(unittest.TestCase):
         with patch('pathlib.Path.read_text', return_value=test_html), \
             patch('pathlib.Path.mkdir'), \
             patch('lassonde.parse_course_timetable_html') as mock_parse, \
-            patch('pathlib.Path.write_text', side_effect=Exception("Write error")), \
+            patch('pathlib.Path.open', side_effect=Exception("Write error")), \
             patch('builtins.print') as mock_print, \
             patch('traceback.print_exc') as mock_traceback:
             
@@ -1,10 +1,7 @@
 """Test cases for helpers/course_parsing.py"""
 
 import unittest
-import sys
 from bs4 import BeautifulSoup
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from helpers.course_parsing import (
     is_header_row,
     parse_course_header,
@@ -16,51 +13,50 @@ from helpers.course_parsing import (
 
 class TestIsHeaderRow(unittest.TestCase):
     """Test is_header_row function"""
-    
-    def test_valid_header_row(self):
-        html = """<tr>
+
+    @classmethod
+    def setUpClass(cls):
+        # Fixtures are read-only, so parse each one once for the whole class.
+        cls.valid_header_row = BeautifulSoup("""<tr>
             <td class="bodytext">Faculty</td>
             <td class="bodytext">Dept</td>
             <td class="bodytext">Term</td>
             <td class="bodytext" colspan="2">Course Title</td>
-        </tr>"""
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-        self.assertTrue(is_header_row(row))
-    
-    def test_non_header_row(self):
-        html = """<tr>
+        </tr>""", "lxml").find("tr")
+        cls.non_header_row = BeautifulSoup("""<tr>
             <td class="bodytext">LECT</td>
             <td class="bodytext">01</td>
-        </tr>"""
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-        self.assertFalse(is_header_row(row))
-    
-    def test_insufficient_cells(self):
-        html = """<tr>
+        </tr>""", "lxml").find("tr")
+        cls.short_row = BeautifulSoup("""<tr>
             <td class="bodytext">A</td>
             <td class="bodytext">B</td>
-        </tr>"""
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-        self.assertFalse(is_header_row(row))
+        </tr>""", "lxml").find("tr")
+
+    def test_valid_header_row(self):
+        self.assertTrue(is_header_row(self.valid_header_row))
+
+    def test_non_header_row(self):
+        self.assertFalse(is_header_row(self.non_header_row))
+
+    def test_insufficient_cells(self):
+        self.assertFalse(is_header_row(self.short_row))
 
 
 class TestParseCourseHeader(unittest.TestCase):
     """Test parse_course_header function"""
-    
-    def test_basic_header(self):
-        html = """<tr>
+
+    @classmethod
+    def setUpClass(cls):
+        cls.header_row = BeautifulSoup("""<tr>
             <td class="bodytext">Faculty of Science</td>
             <td class="bodytext">EECS</td>
             <td class="bodytext">Fall 2024</td>
             <td class="bodytext">Introduction to Programming</td>
-        </tr>"""
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-        result = parse_course_header(row)
-        
+        </tr>""", "lxml").find("tr")
+
+    def test_basic_header(self):
+        result = parse_course_header(self.header_row)
+
         self.assertEqual(result['faculty'], "Faculty of Science")
         self.assertEqual(result['department'], "EECS")
         self.assertEqual(result['term'], "Fall 2024")
@@ -83,31 +79,24 @@ class TestGetSectionType(unittest.TestCase):
 
 class TestFindSectionTypeIndex(unittest.TestCase):
     """Test find_section_type_index function"""
-    
-    def test_finds_lect(self):
-        html = """<tr>
+
+    @classmethod
+    def setUpClass(cls):
+        cls.lect_cells = BeautifulSoup("""<tr>
             <td>EECS 1000</td>
             <td>LECT</td>
             <td>01</td>
-        </tr>"""
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-        cells = row.find_all("td")
-        
-        index = find_section_type_index(cells)
-        self.assertEqual(index, 1)
-    
-    def test_no_section_type(self):
-        html = """<tr>
+        </tr>""", "lxml").find("tr").find_all("td")
+        cls.typeless_cells = BeautifulSoup("""<tr>
             <td>EECS 1000</td>
             <td>3.00</td>
-        </tr>"""
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-        cells = row.find_all("td")
-        
-        index = find_section_type_index(cells)
-        self.assertIsNone(index)
+        </tr>""", "lxml").find("tr").find_all("td")
+
+    def test_finds_lect(self):
+        self.assertEqual(find_section_type_index(self.lect_cells), 1)
+
+    def test_no_section_type(self):
+        self.assertIsNone(find_section_type_index(self.typeless_cells))
 
 
 class TestParseSectionRow(unittest.TestCase):
@@ -120,7 +109,7 @@ class TestParseSectionRow(unittest.TestCase):
             <td class=\"bodytext\">FW</td>
             <td class=\"bodytext\" colspan=\"2\">Test Course</td>
         </tr>"""
-        course = parse_course_header(BeautifulSoup(header_html, "html.parser").find("tr"))
+        course = parse_course_header(BeautifulSoup(header_html, "lxml").find("tr"))
 
         row_html = """<tr>
             <td>1000 3.00 A</td>
@@ -140,7 +129,7 @@ class TestParseSectionRow(unittest.TestCase):
                 </table>
             </td>
         </tr>"""
-        row = BeautifulSoup(row_html, "html.parser").find("tr")
+        row = BeautifulSoup(row_html, "lxml").find("tr")
         detail = parse_section_row(row.find_all("td", recursive=False), course)
 
         self.assertIsNotNone(detail)
@@ -159,7 +148,7 @@ class TestParseSectionRow(unittest.TestCase):
             <td class=\"bodytext\">EDUC</td>
             <td class=\"bodytext\">FW</td>
             <td class=\"bodytext\" colspan=\"2\">Test Course</td>
-        </tr>""", "html.parser").find("tr"))
+        </tr>""", "lxml").find("tr"))
 
         row_html = """<tr>
             <td>1001 3.00 B</td>
@@ -169,7 +158,7 @@ class TestParseSectionRow(unittest.TestCase):
             <td>E77J02</td>
             <td>TBA</td>
         </tr>"""
-        row = BeautifulSoup(row_html, "html.parser").find("tr")
+        row = BeautifulSoup(row_html, "lxml").find("tr")
         detail = parse_section_row(row.find_all("td", recursive=False), course)
 
         self.assertIsNotNone(detail)
@@ -181,7 +170,7 @@ class TestParseSectionRow(unittest.TestCase):
             <td class=\"bodytext\">EDUC</td>
             <td class=\"bodytext\">FW</td>
             <td class=\"bodytext\" colspan=\"2\">Test Course</td>
-        </tr>""", "html.parser").find("tr"))
+        </tr>""", "lxml").find("tr"))
 
         row_html = """<tr>
             <td>1002 3.00 C</td>
@@ -192,7 +181,7 @@ class TestParseSectionRow(unittest.TestCase):
             <td></td>
             <td>Cancelled due to weather</td>
         </tr>"""
-        row = BeautifulSoup(row_html, "html.parser").find("tr")
+        row = BeautifulSoup(row_html, "lxml").find("tr")
         detail = parse_section_row(row.find_all("td", recursive=False), course)
 
         self.assertIsNotNone(detail)
@@ -205,14 +194,14 @@ class TestParseSectionRow(unittest.TestCase):
             <td class=\"bodytext\">EDUC</td>
             <td class=\"bodytext\">FW</td>
             <td class=\"bodytext\" colspan=\"2\">Test Course</td>
-        </tr>""", "html.parser").find("tr"))
+        </tr>""", "lxml").find("tr"))
 
         row_html = """<tr>
             <td>1003 3.00 D</td>
             <td>EN</td>
             <td>04</td>
         </tr>"""
-        row = BeautifulSoup(row_html, "html.parser").find("tr")
+        row = BeautifulSoup(row_html, "lxml").find("tr")
         detail = parse_section_row(row.find_all("td", recursive=False), course)
         self.assertIsNone(detail)
 
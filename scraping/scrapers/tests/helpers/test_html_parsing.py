@@ -1,52 +1,50 @@
 """Test cases for helpers/html_parsing.py"""
 
 import unittest
-import sys
 from bs4 import BeautifulSoup
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from helpers.html_parsing import cell_text
 
 
 class TestCellText(unittest.TestCase):
     """Test cell_text function"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        # Fixtures are read-only, so parse each fragment once for the class.
+        def td(fragment):
+            return BeautifulSoup(fragment, "lxml").find("td")
+
+        cls.simple = td("<td>Hello</td>")
+        cls.nested = td("<td><span>Hello</span> <strong>World</strong></td>")
+        cls.nbsp = td("<td>Hello&nbsp;World</td>")
+        cls.whitespace = td("<td>Hello   \n  World</td>")
+        cls.empty = td("<td></td>")
+        cls.multiple_nbsp = td("<td>A&nbsp;&nbsp;&nbsp;B</td>")
+
     def test_none_element(self):
         self.assertEqual(cell_text(None), "")
-    
+
     def test_simple_text(self):
-        soup = BeautifulSoup("<td>Hello</td>", "html.parser")
-        element = soup.find("td")
-        self.assertEqual(cell_text(element), "Hello")
-    
+        self.assertEqual(cell_text(self.simple), "Hello")
+
     def test_nested_tags(self):
-        soup = BeautifulSoup("<td><span>Hello</span> <strong>World</strong></td>", "html.parser")
-        element = soup.find("td")
-        self.assertEqual(cell_text(element), "Hello World")
-    
+        self.assertEqual(cell_text(self.nested), "Hello World")
+
     def test_nbsp_replacement(self):
-        soup = BeautifulSoup("<td>Hello&nbsp;World</td>", "html.parser")
-        element = soup.find("td")
-        self.assertEqual(cell_text(element), "Hello World")
-    
+        self.assertEqual(cell_text(self.nbsp), "Hello World")
+
     def test_whitespace_normalization(self):
-        soup = BeautifulSoup("<td>Hello   \n  World</td>", "html.parser")
-        element = soup.find("td")
-        self.assertEqual(cell_text(element), "Hello World")
-    
+        self.assertEqual(cell_text(self.whitespace), "Hello World")
+
     def test_empty_element(self):
-        soup = BeautifulSoup("<td></td>", "html.parser")
-        element = soup.find("td")
-        self.assertEqual(cell_text(element), "")
-    
+        self.assertEqual(cell_text(self.empty), "")
+
     def test_multiple_nbsp(self):
-        soup = BeautifulSoup("<td>A&nbsp;&nbsp;&nbsp;B</td>", "html.parser")
-        element = soup.find("td")
-        result = cell_text(element)
+        result = cell_text(self.multiple_nbsp)
         self.assertIn("A", result)
         self.assertIn("B", result)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,101 +1,139 @@
 """Test cases for helpers/parser.py"""
 
 import unittest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from helpers.parser import parse_course_timetable_html
 
+_NO_TABLE_HTML = "<html><body><p>No courses</p></body></html>"
+
+_ALPHANUMERIC_HTML = """
+<table>
+    <tr><td>GS/EECS 6000</td><td>Graduate Course</td><td>3.00</td></tr>
+</table>
+"""
+
+_EMPTY_TABLE_HTML = "<html><body><table></table></body></html>"
+
+_METADATA_HTML = """
+<html>
+    <body>
+        <p class="heading">Course Timetable</p>
+        <p class="bodytext"><strong>Updated Jan 1</strong></p>
+        <table></table>
+    </body>
+</html>
+"""
+
+_BASIC_COURSE_HTML = """
+<table>
+    <tr>
+        <td class="bodytext">Faculty</td>
+        <td class="bodytext">EECS</td>
+        <td class="bodytext">FW 2024</td>
+        <td class="bodytext" colspan="2">Test Course</td>
+    </tr>
+    <tr>
+        <td>1000 3.00 A</td>
+        <td>EN</td>
+        <td>LECT</td>
+        <td>01</td>
+        <td>E77J01</td>
+        <td>
+            <table>
+                <tr>
+                    <td>F</td>
+                    <td>8:30</td>
+                    <td>170</td>
+                    <td>Keele</td>
+                    <td>WC 117</td>
+                </tr>
+            </table>
+        </td>
+    </tr>
+</table>
+"""
+
+
+# Mirrors the live pages, which leave the schedule <td> unclosed so the
+# instructor/notes cells follow it without a closing tag. html.parser keeps
+# them as children of the schedule cell while lxml hoists them to row level;
+# parsing must find them under either backend.
+_UNCLOSED_SCHEDULE_HTML = """
+<table>
+    <tr>
+        <td class="bodytext">Faculty</td>
+        <td class="bodytext">EECS</td>
+        <td class="bodytext">FW 2024</td>
+        <td class="bodytext" colspan="2">Test Course</td>
+    </tr>
+    <tr>
+        <td colspan='3'>&nbsp;</td>
+        <td>1000 3.00 A</td>
+        <td>EN</td>
+        <td>LECT</td>
+        <td>01</td>
+        <td>E77J01</td>
+        <td><table><tr><td>F</td><td>8:30</td><td>170</td><td>Keele</td><td>WC 117</td></tr></table><td>Roy Parteno&nbsp;</td><td>Bring a calculator.</td></tr>
+</table>
+"""
+
 
 class TestParseCourseHTML(unittest.TestCase):
     """Test parse_course_timetable_html function"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        # The fixtures are constants and the parser has no side effects, so
+        # each one is parsed once for the whole class; tests only read the
+        # resulting dicts.
+        cls.empty_result = parse_course_timetable_html("")
+        cls.no_table_result = parse_course_timetable_html(_NO_TABLE_HTML)
+        cls.alphanumeric_result = parse_course_timetable_html(_ALPHANUMERIC_HTML)
+        cls.metadata_result = parse_course_timetable_html(_EMPTY_TABLE_HTML, extract_metadata=True)
+        cls.last_updated_result = parse_course_timetable_html(_METADATA_HTML, extract_metadata=True)
+        cls.no_metadata_result = parse_course_timetable_html(_EMPTY_TABLE_HTML, extract_metadata=False)
+        cls.basic_result = parse_course_timetable_html(_BASIC_COURSE_HTML)
+        cls.unclosed_result = parse_course_timetable_html(_UNCLOSED_SCHEDULE_HTML)
+
     def test_empty_html(self):
         """Test parsing empty HTML"""
-        result = parse_course_timetable_html("")
-        self.assertIn('courses', result)
-        self.assertEqual(result['courses'], [])
-    
+        self.assertIn('courses', self.empty_result)
+        self.assertEqual(self.empty_result['courses'], [])
+
     def test_no_table_html(self):
         """Test HTML without course table"""
-        html = "<html><body><p>No courses</p></body></html>"
-        result = parse_course_timetable_html(html)
-        self.assertIn('courses', result)
-        self.assertEqual(result['courses'], [])
-    
+        self.assertIn('courses', self.no_table_result)
+        self.assertEqual(self.no_table_result['courses'], [])
+
     def test_alphanumeric_course_id_allowed_by_default(self):
         """Test that alphanumeric course IDs are accepted by default"""
-        html = """
-        <table>
-            <tr><td>GS/EECS 6000</td><td>Graduate Course</td><td>3.00</td></tr>
-        </table>
-        """
-        result = parse_course_timetable_html(html)
-        self.assertIsNotNone(result)
-    
+        self.assertIsNotNone(self.alphanumeric_result)
+
     def test_metadata_extraction_enabled(self):
         """Test that metadata is extracted when enabled"""
-        html = "<html><body><table></table></body></html>"
-        result = parse_course_timetable_html(html, extract_metadata=True)
-        self.assertIn('metadata', result)
-        self.assertIsInstance(result['metadata'], dict)
+        self.assertIn('metadata', self.metadata_result)
+        self.assertIsInstance(self.metadata_result['metadata'], dict)
 
     def test_metadata_last_updated_extracted(self):
         """Test metadata lastUpdated extraction"""
-        html = """
-        <html>
-            <body>
-                <p class="heading">Course Timetable</p>
-                <p class="bodytext"><strong>Updated Jan 1</strong></p>
-                <table></table>
-            </body>
-        </html>
-        """
-        result = parse_course_timetable_html(html, extract_metadata=True)
-        self.assertEqual(result["metadata"]["lastUpdated"], "Updated Jan 1")
-    
+        self.assertEqual(self.last_updated_result["metadata"]["lastUpdated"], "Updated Jan 1")
+
     def test_metadata_extraction_disabled(self):
         """Test that metadata is not extracted when disabled"""
-        html = "<html><body><table></table></body></html>"
-        result = parse_course_timetable_html(html, extract_metadata=False)
-        self.assertNotIn('metadata', result)
-    
+        self.assertNotIn('metadata', self.no_metadata_result)
+
     def test_basic_course_structure(self):
         """Test that parsed courses have expected structure"""
-        html = """
-        <table>
-            <tr>
-                <td class="bodytext">Faculty</td>
-                <td class="bodytext">EECS</td>
-                <td class="bodytext">FW 2024</td>
-                <td class="bodytext" colspan="2">Test Course</td>
-            </tr>
-            <tr>
-                <td>1000 3.00 A</td>
-                <td>EN</td>
-                <td>LECT</td>
-                <td>01</td>
-                <td>E77J01</td>
-                <td>
-                    <table>
-                        <tr>
-                            <td>F</td>
-                            <td>8:30</td>
-                            <td>170</td>
-                            <td>Keele</td>
-                            <td>WC 117</td>
-                        </tr>
-                    </table>
-                </td>
-            </tr>
-        </table>
-        """
-        result = parse_course_timetable_html(html)
-        self.assertIn('courses', result)
-        self.assertEqual(len(result["courses"][0]["sections"]), 1)
+        self.assertIn('courses', self.basic_result)
+        self.assertEqual(len(self.basic_result["courses"][0]["sections"]), 1)
+
+    def test_unclosed_schedule_cell_keeps_instructors_and_notes(self):
+        """Test that instructors/notes survive the unclosed schedule <td> markup"""
+        section = self.unclosed_result["courses"][0]["sections"][0]
+        self.assertEqual(section["instructors"], ["Roy Parteno"])
+        self.assertEqual(section["notes"], "Bring a calculator.")
+        self.assertEqual(len(section["schedule"]), 1)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,10 +1,6 @@
 """Test cases for helpers/text_utils.py"""
 
 import unittest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from helpers.text_utils import norm_text, html_to_text
 
@@ -4,7 +4,7 @@ import importlib.util
 import unittest
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import patch, mock_open
 
 SCRAPERS_DIR = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(SCRAPERS_DIR))
@@ -52,7 +52,7 @@ class TestGraduateStudiesIntegration(unittest.TestCase):
         """
         
         with patch('pathlib.Path.read_text', return_value=test_html), \
-             patch('pathlib.Path.write_text') as mock_write, \
+             patch('pathlib.Path.open', mock_open()) as mock_write, \
              patch('pathlib.Path.mkdir'), \
              patch('builtins.print') as mock_print:
             
@@ -70,7 +70,7 @@ class TestGraduateStudiesIntegration(unittest.TestCase):
         invalid_html = "<html><invalid></html>"
         
         with patch('pathlib.Path.read_text', return_value=invalid_html), \
-             patch('pathlib.Path.write_text'), \
+             patch('pathlib.Path.open', mock_open()), \
              patch('pathlib.Path.mkdir'), \
              patch('builtins.print') as mock_print:
             
@@ -84,7 +84,7 @@ class TestGraduateStudiesIntegration(unittest.TestCase):
         test_html = "<table></table>"
         
         with patch('pathlib.Path.read_text', return_value=test_html), \
-            patch('pathlib.Path.write_text'), \
+            patch('pathlib.Path.open', mock_open()), \
             patch('pathlib.Path.mkdir'), \
             patch.object(graduate_studies, 'parse_course_timetable_html') as mock_parse, \
             patch('builtins.print'):
@@ -105,7 +105,7 @@ class TestGraduateStudiesIntegration(unittest.TestCase):
         with patch('pathlib.Path.read_text', return_value=test_html), \
             patch('pathlib.Path.mkdir'), \
             patch.object(graduate_studies, 'parse_course_timetable_html') as mock_parse, \
-            patch('pathlib.Path.write_text', side_effect=Exception("Write error")), \
+            patch('pathlib.Path.open', side_effect=Exception("Write error")), \
             patch('builtins.print') as mock_print, \
             patch('traceback.print_exc') as mock_traceback:
             
@@ -154,7 +154,7 @@ class TestGraduateStudiesIntegration(unittest.TestCase):
         }
         
         with patch('pathlib.Path.read_text', return_value=test_html), \
-            patch('pathlib.Path.write_text'), \
+            patch('pathlib.Path.open', mock_open()), \
             patch('pathlib.Path.mkdir'), \
             patch.object(graduate_studies, 'parse_course_timetable_html', return_value=mock_result), \
             patch('builtins.print') as mock_print: